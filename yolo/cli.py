@@ -11,6 +11,8 @@ from label_studio_ml.response import ModelResponse
 LABEL_STUDIO_URL = os.getenv("LABEL_STUDIO_URL", "http://localhost:8080")
 LABEL_STUDIO_API_KEY = os.getenv("LABEL_STUDIO_API_KEY", "your_api_key")
 PROJECT_ID = os.getenv("LABEL_STUDIO_PROJECT_ID", "1")
+# number of predictions sent to Label Studio in one import request
+PREDICTIONS_BATCH_SIZE = int(os.getenv("PREDICTIONS_BATCH_SIZE", 100))
 
 logger = logging.getLogger(__name__)
 
@@ -59,22 +61,36 @@ class LabelStudioMLPredictor:
         model = YOLO(project_id=str(project.id), label_config=project.label_config)
         logger.info(f"YOLO ML backend is created")
 
-        # predict and send prediction to Label Studio
+        # predict and send predictions to Label Studio in batches
+        batch = []
         for task in tqdm(tasks, desc="Predict tasks"):
             response = model.predict([task])
             predictions = self.postprocess_response(model, response, task)
 
-            # send predictions to Label Studio
-            for prediction in predictions:
-                ls.predictions.create(
-                    task=task["id"],
-                    score=prediction.get("score", 0),
-                    model_version=prediction.get("model_version", "none"),
-                    result=prediction["result"],
+            for prediction in predictions or []:
+                batch.append(
+                    {
+                        "task": task["id"],
+                        "score": prediction.get("score", 0),
+                        "model_version": prediction.get("model_version", "none"),
+                        "result": prediction["result"],
+                    }
                 )
+            if len(batch) >= PREDICTIONS_BATCH_SIZE:
+                self.send_predictions(ls, project.id, batch)
+                batch = []
+
+        if batch:
+            self.send_predictions(ls, project.id, batch)
 
         logger.info("Model predictions are done!")
 
+    @staticmethod
+    def send_predictions(ls, project_id, predictions):
+        """Import predictions to Label Studio with one request instead of one per prediction"""
+        ls.projects.import_predictions(id=project_id, request=predictions)
+        logger.info(f"Sent {len(predictions)} predictions to Label Studio")
+
     @staticmethod
     def postprocess_response(model, response, task):
         if response is None:
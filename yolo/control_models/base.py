@@ -1,8 +1,9 @@
 import os
 import logging
 
+from functools import cached_property
 from pydantic import BaseModel
-from typing import Optional, List, Dict, ClassVar
+from typing import Optional, List, Dict, ClassVar, Tuple
 from ultralytics import YOLO
 
 from label_studio_ml.model import LabelStudioMLBase
@@ -29,8 +30,12 @@ _model_cache = {}
 logger = logging.getLogger(__name__)
 
 
+# values of control tag attributes treated as true
+TRUE_VALUES = frozenset(("1", "true", "yes"))
+
+
 def get_bool(attr, attr_name, default="false"):
-    return attr.get(attr_name, default).lower() in ["1", "true", "yes"]
+    return attr.get(attr_name, default).lower() in TRUE_VALUES
 
 
 class ControlModel(BaseModel):
@@ -62,9 +67,6 @@ class ControlModel(BaseModel):
     label_studio_ml_backend: LabelStudioMLBase
     project_id: Optional[str] = None
 
-    def __init__(self, **data):
-        super().__init__(**data)
-
     @classmethod
     def is_control_matched(cls, control) -> bool:
         """Check if the control tag matches the model type.
@@ -145,12 +147,27 @@ class ControlModel(BaseModel):
             _model_cache[path] = cls.load_yolo_model(path)
         return _model_cache[path]
 
-    def debug_plot(self, image):
+    @cached_property
+    def mapped_model_labels(self) -> Tuple[List[int], List[str]]:
+        """Indexes and names of model classes that are present in the label map.
+        It's computed once per control model instance and reused for all predictions.
+        """
+        ids, names = [], []
+        for i, name in self.model.names.items():
+            if name in self.label_map:
+                ids.append(i)
+                names.append(name)
+        return ids, names
+
+    def debug_plot(self, results):
+        """Plot the first frame of YOLO results, the image is rendered only if DEBUG_PLOT is enabled"""
         if not DEBUG_PLOT:
             return
 
         import matplotlib.pyplot as plt
 
+        image = results[0].plot()
+
         plt.figure(figsize=(10, 10))
         plt.imshow(image[..., ::-1])
         plt.axis("off")
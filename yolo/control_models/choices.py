@@ -2,11 +2,14 @@ import logging
 import numpy as np
 
 from control_models.base import ControlModel
-from typing import List, Dict
+from typing import List, Dict, ClassVar
 
 
 logger = logging.getLogger(__name__)
 
+# values of the `choice` attribute that mean only one choice can be selected
+SINGLE_CHOICE_MODES = frozenset(("single", "single-radio"))
+
 
 class ChoicesModel(ControlModel):
     """
@@ -15,18 +18,19 @@ class ChoicesModel(ControlModel):
 
     type = "Choices"
     model_path = "yolov8n-cls.pt"
+    # support both Choices and Taxonomy because of their similarity
+    control_tags: ClassVar[frozenset] = frozenset((type, "Taxonomy"))
 
     @classmethod
     def is_control_matched(cls, control) -> bool:
         # check object tag type
         if control.objects[0].tag != "Image":
             return False
-        # support both Choices and Taxonomy because of their similarity
-        return control.tag in [cls.type, "Taxonomy"]
+        return control.tag in cls.control_tags
 
     def predict_regions(self, path) -> List[Dict]:
         results = self.model.predict(path)
-        self.debug_plot(results[0].plot())
+        self.debug_plot(results)
         return self.create_choices(results, path)
 
     def create_choices(self, results, path):
@@ -35,13 +39,10 @@ class ChoicesModel(ControlModel):
         data = results[0].probs.data.cpu().numpy()
 
         # single
-        if mode in ["single", "single-radio"]:
+        if mode in SINGLE_CHOICE_MODES:
             # we must keep data items that matches label_map only, because we need to search among label_map only
-            indexes = [
-                i for i, name in self.model.names.items() if name in self.label_map
-            ]
+            indexes, model_names = self.mapped_model_labels
             data = data[indexes]
-            model_names = [self.model.names[i] for i in indexes]
             # find the best choice
             index = np.argmax(data)
             probs = [data[index]]
@@ -60,11 +61,16 @@ class ChoicesModel(ControlModel):
         score = np.mean(probs)
         logger.debug(
             "----------------------\n"
-            f"task id > {path}\n"
-            f"control: {self.control}\n"
-            f"probs > {probs}\n"
-            f"score > {score}\n"
-            f"names > {names}\n"
+            "task id > %s\n"
+            "control: %s\n"
+            "probs > %s\n"
+            "score > %s\n"
+            "names > %s\n",
+            path,
+            self.control,
+            probs,
+            score,
+            names,
         )
 
         if score < self.model_score_threshold:
@@ -86,7 +92,3 @@ class ChoicesModel(ControlModel):
                 "score": float(score),
             }
         ]
-
-
-# pre-load and cache default model at startup
-ChoicesModel.get_cached_model(ChoicesModel.model_path)
@@ -78,19 +78,28 @@ class KeypointLabelsModel(ControlModel):
             point_xyn = (
                 keypoints_data.xyn[bbox_index] * 100
             )  # Convert normalized keypoints to percentages
-            model_label = model_names[int(results[0].boxes.cls[bbox_index])]
-
-            point_logs = "\n".join(
-                [f' model_index="{i}", xy={xyn}' for i, xyn in enumerate(point_xyn)]
-            )
-            logger.debug(
-                "----------------------\n"
-                f"task id > {path}\n"
-                f"type: {self.control}\n"
-                f"model label > {model_label}\n"
-                f"keypoints >\n{point_logs}\n"
-                f"confidences > {bbox_conf}\n"
-            )
+            model_label = model_names[int(bbox_data.cls[bbox_index])]
+
+            if logger.isEnabledFor(logging.DEBUG):
+                point_logs = "\n".join(
+                    [
+                        f' model_index="{i}", xy={xyn}'
+                        for i, xyn in enumerate(point_xyn)
+                    ]
+                )
+                logger.debug(
+                    "----------------------\n"
+                    "task id > %s\n"
+                    "type: %s\n"
+                    "model label > %s\n"
+                    "keypoints >\n%s\n"
+                    "confidences > %s\n",
+                    path,
+                    self.control,
+                    model_label,
+                    point_logs,
+                    bbox_conf,
+                )
 
             # bbox score is too low
             if bbox_conf < self.model_score_threshold:
@@ -167,7 +176,3 @@ class KeypointLabelsModel(ControlModel):
             "hidden": True,
         }
         return region
-
-
-# Pre-load and cache default model at startup
-KeypointLabelsModel.get_cached_model(KeypointLabelsModel.model_path)
@@ -32,20 +32,27 @@ class PolygonLabelsModel(ControlModel):
         model_names = self.model.names
         regions = []
 
-        for i in range(len(data)):
-            score = float(results[0].boxes.conf[i])  # tensor => float
-            points = (
-                data.xyn[i] * 100
-            )  # get the polygon points for the current instance
-            model_label = model_names[int(results[0].boxes.cls[i])]
+        # convert tensors to lists at once instead of per item access
+        scores = results[0].boxes.conf.tolist()
+        classes = results[0].boxes.cls.tolist()
+        polygons = data.xyn
+
+        for score, cls, xyn in zip(scores, classes, polygons):
+            points = xyn * 100  # get the polygon points for the current instance
+            model_label = model_names[int(cls)]
 
             logger.debug(
                 "----------------------\n"
-                f"task id > {path}\n"
-                f"type: {self.control}\n"
-                f"polygon points > {points}\n"
-                f"model label > {model_label}\n"
-                f"score > {score}\n"
+                "task id > %s\n"
+                "type: %s\n"
+                "polygon points > %s\n"
+                "model label > %s\n"
+                "score > %s\n",
+                path,
+                self.control,
+                points,
+                model_label,
+                score,
             )
 
             # bbox score is too low
@@ -71,7 +78,3 @@ class PolygonLabelsModel(ControlModel):
             }
             regions.append(region)
         return regions
-
-
-# pre-load and cache default model at startup
-PolygonLabelsModel.get_cached_model(PolygonLabelsModel.model_path)
@@ -34,7 +34,7 @@ class RectangleLabelsModel(ControlModel):
 
     def predict_regions(self, path) -> List[Dict]:
         results = self.model.predict(path)
-        self.debug_plot(results[0].plot())
+        self.debug_plot(results)
 
         # oriented bounding boxes are detected, but it should be processed by RectangleLabelsObbModel
         if results[0].obb is not None and results[0].boxes is None:
@@ -54,18 +54,26 @@ class RectangleLabelsModel(ControlModel):
         model_names = self.model.names
         regions = []
 
-        for i in range(data.shape[0]):  # iterate over items
-            score = float(data.conf[i])  # tensor => float
-            x, y, w, h = data.xywhn[i].tolist()
-            model_label = model_names[int(data.cls[i])]
+        # convert tensors to lists at once instead of per item access
+        scores = data.conf.tolist()
+        boxes = data.xywhn.tolist()
+        classes = data.cls.tolist()
+
+        for score, (x, y, w, h), cls in zip(scores, boxes, classes):
+            model_label = model_names[int(cls)]
 
             logger.debug(
                 "----------------------\n"
-                f"task id > {path}\n"
-                f"type: {self.control}\n"
-                f"x, y, w, h > {x, y, w, h}\n"
-                f"model label > {model_label}\n"
-                f"score > {score}\n"
+                "task id > %s\n"
+                "type: %s\n"
+                "x, y, w, h > %s\n"
+                "model label > %s\n"
+                "score > %s\n",
+                path,
+                self.control,
+                (x, y, w, h),
+                model_label,
+                score,
             )
 
             # bbox score is too low
@@ -93,7 +101,3 @@ class RectangleLabelsModel(ControlModel):
             }
             regions.append(region)
         return regions
-
-
-# pre-load and cache default model at startup
-RectangleLabelsModel.get_cached_model(RectangleLabelsModel.model_path)
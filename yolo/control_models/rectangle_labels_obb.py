@@ -30,7 +30,7 @@ class RectangleLabelsObbModel(ControlModel):
 
     def predict_regions(self, path) -> List[Dict]:
         results = self.model.predict(path)
-        self.debug_plot(results[0].plot())
+        self.debug_plot(results)
 
         # simple bounding boxes without rotation
         if results[0].obb is None:
@@ -48,23 +48,28 @@ class RectangleLabelsObbModel(ControlModel):
         logger.debug(f"create_rotated_rectangles: {self.from_name}")
         data = results[0].obb  # take bboxes from the first frame
         model_names = self.model.names
+        original_height, original_width = data.orig_shape
         regions = []
 
         for i in range(data.shape[0]):  # iterate over items
             score = float(data.conf[i])  # tensor => float
             model_label = model_names[int(data.cls[i])]
-            original_height, original_width = data.orig_shape
             value = convert_yolo_obb_to_annotation(
                 data.xyxyxyxy[i].tolist(), original_width, original_height
             )
 
             logger.debug(
                 "----------------------\n"
-                f"task id > {path}\n"
-                f"type: {self.control}\n"
-                f"x, y, w, h, r > {value}\n"
-                f"model label > {model_label}\n"
-                f"score > {score}\n"
+                "task id > %s\n"
+                "type: %s\n"
+                "x, y, w, h, r > %s\n"
+                "model label > %s\n"
+                "score > %s\n",
+                path,
+                self.control,
+                value,
+                model_label,
+                score,
             )
 
             # bbox score is too low
@@ -87,7 +92,3 @@ class RectangleLabelsObbModel(ControlModel):
             }
             regions.append(region)
         return regions
-
-
-# pre-load and cache default model at startup
-RectangleLabelsObbModel.get_cached_model(RectangleLabelsObbModel.model_path)
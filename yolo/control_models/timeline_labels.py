@@ -11,6 +11,7 @@ from utils.neural_nets import (
 )
 from utils.converter import (
     get_label_map,
+    get_used_labels,
     convert_timelinelabels_to_probs,
     convert_probs_to_timelinelabels,
 )
@@ -64,18 +65,14 @@ class TimelineLabelsModel(ControlModel):
     def create_timelines_simple(self, video_path):
         logger.debug(f"create_timelines_simple: {self.from_name}")
         # get yolo predictions
-        frame_results = cached_yolo_predict(
+        frame_probs = cached_yolo_predict(
             self.model, video_path, self.model.model_name
         )
 
-        # Initialize a dictionary to keep track of ongoing segments for each label
-        model_names = self.model.names
-        needed_ids = [i for i, name in model_names.items() if name in self.label_map]
-        needed_labels = [
-            name for i, name in model_names.items() if name in self.label_map
-        ]
+        # Keep only model classes that are mapped to Label Studio labels
+        needed_ids, needed_labels = self.mapped_model_labels
 
-        probs = [frame.probs.data[needed_ids].cpu().numpy() for frame in frame_results]
+        probs = [frame[needed_ids].numpy() for frame in frame_probs]
         label_map = {
             self.label_map[label]: idx for idx, label in enumerate(needed_labels)
         }
@@ -87,11 +84,10 @@ class TimelineLabelsModel(ControlModel):
     def create_timelines_trainable(self, video_path):
         logger.debug(f"create_timelines_trainable: {self.from_name}")
         # extract features based on pre-trained yolo classification model
-        frame_results = cached_feature_extraction(
+        yolo_probs = cached_feature_extraction(
             self.model, video_path, self.model.model_name
         )
 
-        yolo_probs = [frame.probs for frame in frame_results]
         path = self.get_classifier_path(self.project_id)
         classifier = BaseNN.load_cached_model(path)
         if not classifier:
@@ -212,19 +208,11 @@ class TimelineLabelsModel(ControlModel):
         annotation = data["annotation"]
         regions = annotation["result"]
 
-        # Get the features and labels for training
-        video_path = self.get_path(task)
-        frames = cached_feature_extraction(
-            self.model, video_path, self.model.model_name
-        )
-        features = [frame.probs for frame in frames]
+        # Check if all annotation labels are in the label_map
+        # before running the heavy feature extraction
         label_map = get_label_map(self.control.labels)
-        labels, used_labels = convert_timelinelabels_to_probs(
-            regions, label_map=label_map, max_frame=len(frames)
-        )
-
-        # Check if all labels from used_labels are in the label_map
-        if not used_labels.issubset(label_map.keys()):
+        used_labels = get_used_labels(regions)
+        if used_labels - label_map.keys():
             raise ValueError(
                 f"Annotation labels set ({used_labels}) is not subset "
                 f"of labels from the labeling config:\n{self.control}\n"
@@ -232,13 +220,18 @@ class TimelineLabelsModel(ControlModel):
                 f"and labels in the annotation #{data['annotation']['id']}"
                 f"of project #{project_id}."
             )
+
+        # Get the features and labels for training
+        video_path = self.get_path(task)
+        features = cached_feature_extraction(
+            self.model, video_path, self.model.model_name
+        )
+        labels, _ = convert_timelinelabels_to_probs(
+            regions, label_map=label_map, max_frame=len(features)
+        )
         return features, labels, label_map, project_id
 
     def get_classifier_path(self, project_id):
         yolo_base_name = os.path.splitext(os.path.basename(self.model.model_name))[0]
         path = f"{MODEL_ROOT}/timelinelabels-{project_id}-{yolo_base_name}-{self.from_name}.pkl"
         return path
-
-
-# Preload and cache the default yolo model at startup
-TimelineLabelsModel.get_cached_model(TimelineLabelsModel.model_path)
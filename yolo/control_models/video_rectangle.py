@@ -5,6 +5,7 @@ import yaml
 import hashlib
 
 from collections import defaultdict
+from functools import lru_cache
 from control_models.base import ControlModel, MODEL_ROOT
 from label_studio_sdk.label_interface.control_tags import ControlTag
 from typing import List, Dict, Union
@@ -13,6 +14,19 @@ from typing import List, Dict, Union
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _load_tracker_config(yaml_path: str, mtime: float) -> Dict:
+    with open(yaml_path, "r") as file:
+        return yaml.safe_load(file)
+
+
+def load_tracker_config(yaml_path: str) -> Dict:
+    """Load the original tracker yaml, parsed configs are cached until the file is modified
+    (tracker yamls can be edited in the mounted models directory)
+    """
+    return _load_tracker_config(yaml_path, os.path.getmtime(yaml_path))
+
+
 class VideoRectangleModel(ControlModel):
     """
     Class representing a RectangleLabels (bounding boxes) control tag for YOLO model.
@@ -72,19 +86,19 @@ class VideoRectangleModel(ControlModel):
         tmp_yaml = self.update_tracker_params(original, prefix=tracker_name + "_")
         tracker = tmp_yaml if tmp_yaml else original
 
-        # run model track
+        # run model track, with stream=True it's a lazy generator,
+        # so the tracker yaml is read only when results are consumed
         try:
             results = self.model.track(
                 path, conf=conf, iou=iou, tracker=tracker, stream=True
             )
+            # convert model results to label studio regions
+            return self.create_video_rectangles(results, path)
         finally:
             # clean temporary file
             if tmp_yaml and os.path.exists(tmp_yaml):
                 os.remove(tmp_yaml)
 
-        # convert model results to label studio regions
-        return self.create_video_rectangles(results, path)
-
     def create_video_rectangles(self, results, path):
         """Create regions of video rectangles from the yolo tracker results"""
         frames_count, duration = self.get_video_duration(path)
@@ -192,11 +206,11 @@ class VideoRectangleModel(ControlModel):
             # no custom parameters, exit
             return None
 
-        # Load the original yaml file
-        with open(yaml_path, "r") as file:
-            config = yaml.safe_load(file)
+        # Load the original yaml file, copy it to keep the cached config untouched
+        config = dict(load_tracker_config(yaml_path))
 
         # Extract parameters with prefix from ControlTag
+        changed = False
         for attr_name, attr_value in self.control.attr.items():
             if attr_name.startswith(prefix):
                 # Remove prefix and update the corresponding yaml key
@@ -210,7 +224,13 @@ class VideoRectangleModel(ControlModel):
                 elif isinstance(config[key], float):
                     attr_value = float(attr_value)
 
-                config[key] = attr_value
+                if config[key] != attr_value:
+                    config[key] = attr_value
+                    changed = True
+
+        # all custom parameters match the original ones, no need to write a new file
+        if not changed:
+            return None
 
         # Generate a new filename with a random hash
         new_yaml_filename = self.generate_hash_filename()
@@ -221,7 +241,3 @@ class VideoRectangleModel(ControlModel):
 
         # Return the new filename
         return new_yaml_filename
-
-
-# pre-load and cache default model at startup
-VideoRectangleModel.get_cached_model(VideoRectangleModel.model_path)
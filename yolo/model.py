@@ -30,6 +30,14 @@ available_model_classes = [
     TimelineLabelsModel,
 ]
 
+# pre-load and cache default models of all control models at startup
+for model_class in available_model_classes:
+    model_class.get_cached_model(model_class.model_path)
+
+# Global cache for detected control models: project_id => (label_config, control_models),
+# only the latest labeling config is kept for each project
+_control_models_cache = {}
+
 
 class YOLO(LabelStudioMLBase):
     """Label Studio ML Backend based on Ultralytics YOLO"""
@@ -92,6 +100,23 @@ class YOLO(LabelStudioMLBase):
 
         return control_models
 
+    def get_cached_control_models(self) -> List[ControlModel]:
+        """Detect control models once per project and labeling config,
+        then reuse them for the next predict and fit calls.
+        """
+        label_config = self.label_config
+        if not label_config:
+            return self.detect_control_models()
+
+        cached_config, control_models = _control_models_cache.get(
+            self.project_id, (None, None)
+        )
+        # labeling config was changed, replace the old project entry
+        if cached_config != label_config:
+            control_models = self.detect_control_models()
+            _control_models_cache[self.project_id] = (label_config, control_models)
+        return control_models
+
     def predict(
         self, tasks: List[Dict], context: Optional[Dict] = None, **kwargs
     ) -> ModelResponse:
@@ -106,7 +131,7 @@ class YOLO(LabelStudioMLBase):
         logger.info(
             f"Run prediction on {len(tasks)} tasks, project ID = {self.project_id}"
         )
-        control_models = self.detect_control_models()
+        control_models = self.get_cached_control_models()
 
         predictions = []
         for task in tasks:
@@ -136,7 +161,7 @@ class YOLO(LabelStudioMLBase):
         Or it's called when "Start training" clicked on the model in the project settings.
         """
         results = {}
-        control_models = self.detect_control_models()
+        control_models = self.get_cached_control_models()
         for model in control_models:
             training_result = model.fit(event, data, **kwargs)
             results[model.from_name] = training_result
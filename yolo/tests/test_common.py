@@ -7,7 +7,7 @@ import pickle
 import pytest
 import json
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 from model import YOLO
 
 
@@ -189,3 +189,30 @@ def test_control_with_valid_label_map(
     assert len(result) == 1
     assert result[0] == mock_instance
     mock_logger.debug.assert_called_once()
+
+
+def test_cached_control_models(yolo_instance, mocker):
+    cache = mocker.patch("model._control_models_cache", {})
+    label_config = mocker.patch.object(
+        YOLO, "label_config", new_callable=PropertyMock, return_value="<View/>"
+    )
+    detect = mocker.patch.object(
+        yolo_instance,
+        "detect_control_models",
+        side_effect=lambda: [MagicMock()],
+    )
+
+    first = yolo_instance.get_cached_control_models()
+    second = yolo_instance.get_cached_control_models()
+
+    assert first is second
+    detect.assert_called_once()
+
+    # labeling config changed => models are detected again and the old entry is replaced
+    label_config.return_value = "<View></View>"
+    third = yolo_instance.get_cached_control_models()
+
+    assert third is not first
+    assert detect.call_count == 2
+    assert len(cache) == 1
+    assert cache[yolo_instance.project_id] == ("<View></View>", third)
@@ -1,3 +1,5 @@
+import os
+import threading
 import pytest
 import torch
 
@@ -56,3 +58,33 @@ def test_multi_label_lstm():
     assert torch.equal(
         torch.tensor(labels), loaded_labels.int()
     ), "Predicted labels do not match the training labels."
+
+
+def test_save_and_load(tmp_path):
+    model = MultiLabelLSTM(input_size=8, output_size=2, device=torch.device("cpu"))
+    model.set_label_map({"Car": 0, "Bus": 1})
+    path = str(tmp_path / "classifier.pkl")
+
+    # several threads save the same model path at the same time
+    errors = []
+
+    def save():
+        try:
+            model.save(path)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=save) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors, f"Concurrent save failed: {errors}"
+    # no temporary files are left next to the model
+    assert os.listdir(tmp_path) == ["classifier.pkl"]
+
+    loaded_model = MultiLabelLSTM.load(path)
+    assert loaded_model.get_label_map() == {"Car": 0, "Bus": 1}
+    for key, value in model.state_dict().items():
+        assert torch.equal(value, loaded_model.state_dict()[key])
@@ -3,6 +3,7 @@ This file contains tests for the API of your model. You can run these tests by i
 """
 
 import os
+import sys
 import json
 import pytest
 import numpy as np
@@ -395,3 +396,59 @@ def test_timelinelabels_no_label_match():
         "TimelinesLabels model works in simple mode (without training), "
         "but no labels from YOLO model names are matched"
     ) in str(excinfo.value)
+
+
+def test_convert_probs_to_timelinelabels_tensor():
+    import torch
+
+    probs = [[0.8, 0.2], [0.9, 0.1], [0.1, 0.9]]
+    label_map = {"Rain": 0, "Snow": 1}
+
+    from_list = convert_probs_to_timelinelabels(probs, label_map, "videoLabels")
+    from_tensor = convert_probs_to_timelinelabels(
+        torch.tensor(probs), label_map, "videoLabels"
+    )
+
+    compare_nested_structures(from_tensor, from_list, rel=1e-6)
+
+
+def test_load_features_and_labels_mismatch_skips_extraction():
+    """Annotation labels are validated before the heavy feature extraction"""
+    label_config = """
+    <View>
+        <TimelineLabels name="videoLabels" toName="video" model_trainable="true">
+            <Label value="Car"/>
+            <Label value="croquet_ball"/>
+        </TimelineLabels>
+        <Video name="video" value="$video" />
+    </View>
+    """
+    ml = LabelStudioMLBase(label_config=label_config)
+    control = list(ml.label_interface.controls)[0]
+    model = TimelineLabelsModel.create(ml, control=control)
+
+    data = {
+        "task": {"project": 42, "data": {"video": "tests/opossum_snow_short.mp4"}},
+        "annotation": {
+            "id": 1,
+            "result": [
+                {
+                    "from_name": "videoLabels",
+                    "to_name": "video",
+                    "type": "timelinelabels",
+                    "value": {
+                        "ranges": [{"start": 1, "end": 5}],
+                        "timelinelabels": ["Bus"],
+                    },
+                }
+            ],
+        },
+    }
+
+    module = sys.modules[TimelineLabelsModel.__module__]
+    with patch.object(module, "cached_feature_extraction") as mock_extraction:
+        with pytest.raises(ValueError) as excinfo:
+            model.load_features_and_labels(data)
+
+    assert "is not subset of labels from the labeling config" in str(excinfo.value)
+    mock_extraction.assert_not_called()
@@ -177,3 +177,69 @@ def test_update_tracker_params_with_real_config():
 
     # Clean up: remove the temporary YAML file
     os.remove(new_yaml_path)
+
+
+def test_update_tracker_params_same_values(tmp_path):
+    label_config = """
+    <View>
+       <Labels name="videoLabels" toName="video" allowEmpty="true">
+         <Label value="person" background="blue"/>
+       </Labels>
+       <Video name="video" value="$video" framerate="25.0"/>
+       <VideoRectangle name="box" toName="video" botsort_track_buffer="30" />
+    </View>
+    """
+    ml = YOLO(project_id="42", label_config=label_config)
+    video_rectangle_model = ml.detect_control_models()[0]
+
+    original_yaml_path = f"{tmp_path}/botsort.yaml"
+    with open(original_yaml_path, "w") as file:
+        file.write("tracker_type: botsort\ntrack_buffer: 30\n")
+
+    # parameters from the labeling config are equal to the original ones,
+    # so no temporary yaml should be created
+    assert (
+        video_rectangle_model.update_tracker_params(original_yaml_path, "botsort_")
+        is None
+    )
+
+
+def test_load_tracker_config_reloads_modified_file(tmp_path):
+    from control_models.video_rectangle import load_tracker_config
+
+    yaml_path = f"{tmp_path}/botsort.yaml"
+    with open(yaml_path, "w") as file:
+        file.write("tracker_type: botsort\ntrack_buffer: 30\n")
+    assert load_tracker_config(yaml_path)["track_buffer"] == 30
+
+    # edit the file, the cached config must not be used anymore
+    with open(yaml_path, "w") as file:
+        file.write("tracker_type: botsort\ntrack_buffer: 50\n")
+    stat = os.stat(yaml_path)
+    os.utime(yaml_path, (stat.st_atime, stat.st_mtime + 10))
+    assert load_tracker_config(yaml_path)["track_buffer"] == 50
+
+
+def test_tracker_yaml_exists_while_results_are_consumed():
+    """model.track(stream=True) is lazy and reads the tracker yaml on iteration,
+    so the temporary yaml must be removed only after results are consumed
+    """
+    ml = YOLO(project_id="42", label_config=label_configs[0])
+    video_rectangle_model = ml.detect_control_models()[0]
+    tracker_paths = []
+
+    def lazy_track(*args, **kwargs):
+        tracker = kwargs["tracker"]
+        tracker_paths.append(tracker)
+        for result in yolo_results[0]:
+            assert os.path.exists(tracker), "Tracker yaml is removed too early"
+            yield result
+
+    with mock.patch("ultralytics.YOLO.track", side_effect=lazy_track):
+        regions = video_rectangle_model.predict_regions(tasks[0]["data"]["video"])
+
+    assert regions == expected[0][0]["result"]
+    # custom botsort parameters => temporary yaml was used and then removed
+    assert len(tracker_paths) == 1
+    assert "/tmp/" in tracker_paths[0]
+    assert not os.path.exists(tracker_paths[0])
@@ -14,6 +14,19 @@ def get_label_map(labels: List[str]) -> Dict:
     return {label: idx for idx, label in enumerate(sorted(labels))}
 
 
+def get_used_labels(regions: List[Dict]) -> set:
+    """
+    Collect all unique labels used in timeline regions.
+    Args:
+        regions: List of timeline regions from annotation
+    Returns:
+        used_labels: Set of label names
+    """
+    return {
+        label for region in regions for label in region["value"]["timelinelabels"]
+    }
+
+
 def convert_timelinelabels_to_probs(
     regions: List[Dict], label_map: Dict[str, int], max_frame=None
 ) -> (np.ndarray, Dict):
@@ -26,13 +39,8 @@ def convert_timelinelabels_to_probs(
         labels_array: Numpy array with shape (num_frames, num_labels)
         used_labels: Labels that were used in the regions
     """
-    # Step 1: Collect all unique labels and map them to an index
-    used_labels = set()
-
     # Step 1: Identify all unique labels
-    for region in regions:
-        labels = region["value"]["timelinelabels"]
-        used_labels.update(labels)
+    used_labels = get_used_labels(regions)
 
     # Step 2: Find the maximum frame index to define the array's X-axis size
     if max_frame is None:
@@ -83,6 +91,10 @@ def convert_probs_to_timelinelabels(
     if num_frames == 0:
         return regions
 
+    # Convert torch tensor to numpy once instead of converting each element in the loop
+    if hasattr(probs, "cpu"):
+        probs = probs.cpu().numpy()
+
     # Iterate through each frame
     for i in range(num_frames):
         # Get probabilities for the current frame
@@ -90,7 +102,7 @@ def convert_probs_to_timelinelabels(
 
         # Iterate through each label
         for label, label_idx in label_mapping.items():
-            prob = frame_probs[label_idx]
+            prob = float(frame_probs[label_idx])
             segment = ongoing_segments[label]
 
             # Check if the probability exceeds the threshold
@@ -100,11 +112,11 @@ def convert_probs_to_timelinelabels(
                     segment["idx"] = added
                     segment["start"] = i + 1
                     segment["label"] = label
-                    segment["score"] = float(prob)
+                    segment["score"] = prob
                     segment["from_name"] = from_name
                     added += 1
                 else:
-                    segment["score"] += float(prob)
+                    segment["score"] += prob
             else:
                 # Close the ongoing segment if probability falls below the threshold
                 if segment:
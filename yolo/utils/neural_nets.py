@@ -1,4 +1,5 @@
 import os
+import tempfile
 import torch
 import torch.nn as nn
 import torch.optim as optim
@@ -23,18 +24,21 @@ _models = {}
 
 @memory.cache(ignore=["yolo_model"])
 def cached_yolo_predict(yolo_model, video_path, cache_params):
-    """Predict bounding boxes and labels using YOLO model and cache the results using joblib.
+    """Predict class probabilities per frame using YOLO classification model
+    and cache the results using joblib.
     Args:
         yolo_model (YOLO): YOLO model instance
         video_path (str): Path to the video file
         cache_params (str): Parameters for caching the results, they are used in @memory.cache decorator
+    Returns:
+        List of probability tensors (one per frame), other frame results are not stored
     """
     frames = []
     generator = yolo_model.predict(video_path, stream=True)
 
     for frame in generator:
-        frame.orig_img = None  # remove image from cache to reduce size
-        frames.append(frame)
+        # keep only probabilities to reduce cache size, images and boxes are not needed
+        frames.append(frame.probs.data.cpu())
 
     return frames
 
@@ -46,6 +50,8 @@ def cached_feature_extraction(yolo_model, video_path, cache_params):
         yolo_model (YOLO): YOLO model instance
         video_path (str): Path to the video file
         cache_params (str): Parameters for caching the results, they are used in @memory.cache decorator
+    Returns:
+        List of feature tensors (one per frame)
     """
     layer_output = [None]
 
@@ -59,16 +65,14 @@ def cached_feature_extraction(yolo_model, video_path, cache_params):
     # Run model prediction, use stream to avoid out of memory
     generator = yolo_model.predict(video_path, stream=True)
 
-    # Replace probs with last layer outputs
-    frames = []
-    for frame in generator:
-        frame.orig_img = None  # remove image from cache to reduce size
-        frame.probs = layer_output[0][0][0]  # => tensor, 1280 floats for yolov8n-cls
-        frames.append(frame)
+    # Keep only last layer outputs, the rest of frame results is not needed
+    features = []
+    for _ in generator:
+        features.append(layer_output[0][0][0])  # => tensor, 1280 floats for yolov8n-cls
 
     # Remove the hook
     hook_handle.remove()
-    return frames
+    return features
 
 
 class BaseNN(nn.Module):
@@ -83,13 +87,27 @@ class BaseNN(nn.Module):
         return self.label_map
 
     def save(self, path):
-        # ultralytics yolo11 patches torch.save to use dill,
-        # however it leads to serialization errors,
-        # so let's check for use_dill and disable it
-        if 'use_dill' in torch.save.__code__.co_varnames:
-            torch.save(self, path, use_dill=False)
-        else:
-            torch.save(self, path)
+        # write to a temporary file first and then replace the target atomically,
+        # so concurrent predictions never load a partially written model
+        # (unique temporary file per call, because several threads can save the same model)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
+        )
+        os.close(fd)
+        try:
+            # ultralytics yolo11 patches torch.save to use dill,
+            # however it leads to serialization errors,
+            # so let's check for use_dill and disable it
+            if 'use_dill' in torch.save.__code__.co_varnames:
+                torch.save(self, tmp_path, use_dill=False)
+            else:
+                torch.save(self, tmp_path)
+            # mkstemp creates owner-only files, keep the usual model file permissions
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
         logger.info(f"Model saved to {path}")
 
     @classmethod
@@ -102,7 +120,9 @@ class BaseNN(nn.Module):
     @classmethod
     def load_cached_model(cls, model_path: str) -> Union["BaseNN", None]:
         global _models
+        # Model file was removed (e.g. to reset the classifier), drop it from memory too
         if not os.path.exists(model_path):
+            _models.pop(model_path, None)
             return None
 
         # Load per-project classifier
@@ -331,7 +351,9 @@ class MultiLabelLSTM(BaseNN):
 
         batches, _ = self.preprocess_sequence(sequence, overlap=1)
         self.eval()
-        logits = torch.sigmoid(self(batches))
+        # inference only, don't build autograd graph
+        with torch.no_grad():
+            logits = torch.sigmoid(self(batches))
 
         # Concatenate batches to sequence back
         shape = logits.shape